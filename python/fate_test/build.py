@@ -0,0 +1,29 @@
+# optional: compile the suite parser with Cython, in place, for an editable install
+#
+#   cd ${FATE}/python/fate_test && python build.py
+#
+# remove the generated fate_test/_parser.*.so to go back to the pure python parser
+import sys
+
+cython_modules = ["fate_test/_parser.py"]
+
+
+def build():
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        sys.exit("Cython is required to compile fate_test, install it with `pip install Cython`")
+    from setuptools import Distribution
+
+    distribution = Distribution({
+        "name": "fate_test",
+        "ext_modules": cythonize(cython_modules, compiler_directives={"language_level": 3})
+    })
+    build_ext = distribution.get_command_obj("build_ext")
+    build_ext.inplace = True
+    build_ext.ensure_finalized()
+    build_ext.run()
+
+
+if __name__ == "__main__":
+    build()
@@ -197,13 +197,15 @@ class Config(object):
         config = {}
         if path is not None:
             file_type = path.suffix
-            with path.open("r") as f:
-                if file_type == ".yaml":
+            if file_type == ".yaml":
+                with path.open("r") as f:
                     config.update(yaml.safe_load(f))
-                elif file_type == ".json":
-                    config.update(json.load(f))
-                else:
-                    raise ValueError(f"Cannot load conf from file type {file_type}")
+            elif file_type == ".json":
+                # let the json parser decode the raw bytes itself
+                with path.open("rb") as f:
+                    config.update(json.loads(f.read()))
+            else:
+                raise ValueError(f"Cannot load conf from file type {file_type}")
         return config
 
 
@@ -62,7 +62,7 @@ class FLOWClient(object):
 
     def submit_job(self, job: Job, callback=None) -> 'SubmitJobResponse':
         try:
-            response = self._submit_job(**job.submit_params)
+            response = self._submit_job(job.submit_json_bytes())
             if callback is not None:
                 callback(response)
             status = self._awaiting(response.job_id, "guest", callback)
@@ -127,12 +127,9 @@ class FLOWClient(object):
         response = self._post(url='table/delete', json={'table_name': table_name, 'namespace': namespace})
         return response
 
-    def _submit_job(self, conf, dsl):
-        post_data = {
-            'job_dsl': dsl,
-            'job_runtime_conf': conf
-        }
-        response = SubmitJobResponse(self._post(url='job/submit', json=post_data))
+    def _submit_job(self, post_data: bytes):
+        response = SubmitJobResponse(self._post(url='job/submit', data=post_data,
+                                                headers={'Content-Type': 'application/json'}))
         return response
 
     def _deploy_model(self, model_id, model_version, dsl=None):
@@ -14,9 +14,17 @@
 #  limitations under the License.
 #
 
+import copy
+import functools
+import heapq
+import itertools
 import json
+import os
+import re
+import sys
 import typing
-from collections import deque
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -24,14 +32,192 @@ import prettytable
 
 from fate_test._config import Parties, Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+else:
+    # streaming relies on `use_float`, added in ijson 3.1
+    if tuple(int(v) for v in re.findall(r"\d+", getattr(ijson, "__version__", "0"))[:2]) < (3, 1):
+        ijson = None
+
+# smaller suites load their jobs sequentially, thread pool startup would dominate
+_PARALLEL_LOAD_THRESHOLD = 4
+
+# below this size a full parse beats ijson's per-event overhead
+_STREAM_THRESHOLD = 1 << 20
+
+
+# orjson turns integers outside 64 bits into floats, runs of 19+ digits may be one of those
+_MAYBE_WIDE_INT = re.compile(rb"\d{19}")
+
+
+def _json_loads(s):
+    if orjson is not None:
+        if not _MAYBE_WIDE_INT.search(s):
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                # possibly NaN/Infinity literals, which only the stdlib parser accepts
+                pass
+        return json.loads(s)
+    return json.loads(s)
+
+
+def _apply_hook(obj, hook):
+    """
+    apply `hook` to every dict in a parsed json object, innermost first,
+    the same order `json.load(..., object_hook=hook)` would call it, a `None` hook leaves `obj` untouched
+    """
+    if hook is None:
+        return obj
+    holder = [obj]
+    pending = [(holder, 0, obj)]
+    dict_nodes = []
+    while pending:
+        parent, key, node = pending.pop()
+        if isinstance(node, dict):
+            dict_nodes.append((parent, key, node))
+            children = node.items()
+        elif isinstance(node, list):
+            children = enumerate(node)
+        else:
+            continue
+        for k, v in children:
+            if isinstance(v, (dict, list)):
+                pending.append((node, k, v))
+
+    # every dict is collected before its descendants, so walking backwards hooks children first
+    for parent, key, node in reversed(dict_nodes):
+        parent[key] = hook(node)
+    return holder[0]
+
+
+# longer strings are unlikely to repeat across configs
+_INTERN_MAX_LENGTH = 64
+
+
+def _intern_walk(obj):
+    """
+    intern short string values of a parsed json object in place, so repeated values such as roles,
+    backends and namespaces share one object, keys are already shared by the parser
+    """
+    pending = deque([obj])
+    while pending:
+        node = pending.popleft()
+        if isinstance(node, dict):
+            children = node.items()
+        elif isinstance(node, list):
+            children = enumerate(node)
+        else:
+            continue
+        for k, v in children:
+            if isinstance(v, str):
+                if len(v) <= _INTERN_MAX_LENGTH:
+                    node[k] = sys.intern(v)
+            elif isinstance(v, (dict, list)):
+                pending.append(v)
+    return obj
+
+
+_parsed_cache: typing.MutableMapping[typing.Tuple[str, int, int], typing.Any] = {}
+
+
+def _load_json(path: Path, hook):
+    """
+    parse json file at `path`, reusing the result of earlier loads of the same unmodified file
+
+    hooks are applied to a fresh copy on every call, so callers are free to mutate the result
+    """
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key not in _parsed_cache:
+        with path.open("rb") as f:
+            _parsed_cache[key] = _intern_walk(_json_loads(f.read()))
+    return _apply_hook(copy.deepcopy(_parsed_cache[key]), hook)
+
+
+def _fast_join(base: Path, rel) -> Path:
+    """
+    absolute, normalized `base`/`rel` without the per-file syscalls of `Path.resolve`, symlinks are kept
+    """
+    return Path(os.path.abspath(os.path.join(base, rel)))
+
+
+def _listing_file_exists():
+    """
+    existence check that lists each parent directory once with `os.scandir`,
+    instead of one `stat` per checked file
+
+    a listing only confirms plain entries, anything else (other case, symlinks,
+    unreadable directories) is settled by `Path.exists`, so results match it
+    """
+    listings = {}
+
+    def _exists(file_path: Path):
+        parent = str(file_path.parent)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries if not entry.is_symlink()}
+            except OSError:
+                listings[parent] = frozenset()
+        return file_path.name in listings[parent] or file_path.exists()
+
+    return _exists
+
+
+def _should_stream(path: Path):
+    return ijson is not None and path.stat().st_size >= _STREAM_THRESHOLD
+
+
+# suite files are hooked per record (data item, task, pipeline task, benchmark pair) rather than as a whole
+# document, so streamed and fully parsed suites see exactly the same hook calls
+def _hooked_items(items, hook):
+    for item in items:
+        yield _apply_hook(item, hook)
+
+
+def _hooked_kvitems(kvitems, hook):
+    for k, v in kvitems:
+        yield k, _apply_hook(v, hook)
+
+
+def _stream_json_items(path: Path, prefix, hook):
+    """
+    lazily yield hooked items of the json array at `prefix` in file `path`
+    """
+    with path.open("rb") as f:
+        for item in ijson.items(f, prefix, use_float=True):
+            yield _apply_hook(_intern_walk(item), hook)
+
+
+def _stream_json_kvitems(path: Path, prefix, hook):
+    """
+    lazily yield hooked key-value pairs of the json object at `prefix` in file `path`
+    """
+    with path.open("rb") as f:
+        for k, v in ijson.kvitems(f, prefix, use_float=True):
+            yield k, _apply_hook(_intern_walk(v), hook)
+
 
 # noinspection PyPep8Naming
 class chain_hook(object):
     def __init__(self):
         self._hooks = []
+        # None until a hook is registered, so loaders can skip walking parsed trees entirely
+        self.hook = None
 
     def add_hook(self, hook):
+        if hook is _identity_hook:
+            return self
         self._hooks.append(hook)
+        self.hook = functools.reduce(_compose_hooks, self._hooks)
         return self
 
     def add_extend_namespace_hook(self, namespace):
@@ -41,16 +227,19 @@ class chain_hook(object):
     def add_replace_hook(self, mapping):
         self.add_hook(_replace_hook(mapping))
 
-    def hook(self, d):
-        return self._chain_hooks(self._hooks, d)
 
-    @staticmethod
-    def _chain_hooks(hook_funcs, d):
-        for hook_func in hook_funcs:
-            if d is None:
-                return
-            d = hook_func(d)
-        return d
+def _identity_hook(d):
+    return d
+
+
+def _compose_hooks(first, second):
+    def _hook(d):
+        d = first(d)
+        if d is None:
+            return
+        return second(d)
+
+    return _hook
 
 
 DATA_JSON_HOOK = chain_hook()
@@ -59,18 +248,20 @@ DSL_JSON_HOOK = chain_hook()
 
 
 class Data(object):
+    __slots__ = ('config', 'role_str')
+
     def __init__(self, config: dict, role_str: str):
         self.config = config
         self.role_str = role_str
 
     @staticmethod
-    def load(config, path: Path):
+    def load(config, path: Path, file_exists: typing.Callable[[Path], bool] = Path.exists):
         kwargs = {}
         for field_name in ['head', 'partition', 'table_name', 'namespace']:
             kwargs[field_name] = config[field_name]
 
-        file_path = path.parent.joinpath(config['file']).resolve()
-        if not file_path.exists():
+        file_path = _fast_join(path.parent, config['file'])
+        if not file_exists(file_path):
             kwargs['file'] = config['file']
             # raise ValueError(f"loading from data config: {config} in {path} failed, file: {file_path} not exists")
         else:
@@ -79,21 +270,68 @@ class Data(object):
         return Data(config=kwargs, role_str=role_str)
 
     def update(self, config: Config):
-        self.config.update(dict(work_mode=config.work_mode, backend=config.backend))
+        self.config.update(work_mode=config.work_mode, backend=config.backend)
 
 
 class JobConf(object):
+    """
+    `as_dict(copy=False)` is cached, and the cache is only dropped when `initiator`, `role` or `job_parameters`
+    is reassigned or an `update*` method runs; change `others_kwargs` only through those, or it goes stale
+    """
+
     def __init__(self,
                  initiator: dict,
                  role: dict,
                  job_parameters: dict,
                  **kwargs):
+        self._dict: typing.Optional[dict] = None
         self.initiator = initiator
         self.role = role
         self.job_parameters = job_parameters
         self.others_kwargs = kwargs
 
-    def as_dict(self):
+    @property
+    def initiator(self):
+        return self._initiator
+
+    @initiator.setter
+    def initiator(self, value):
+        self._initiator = value
+        self._invalidate()
+
+    @property
+    def role(self):
+        return self._role
+
+    @role.setter
+    def role(self, value):
+        self._role = value
+        self._invalidate()
+
+    @property
+    def job_parameters(self):
+        return self._job_parameters
+
+    @job_parameters.setter
+    def job_parameters(self, value):
+        self._job_parameters = value
+        self._invalidate()
+
+    def _invalidate(self):
+        self._dict = None
+
+    def as_dict(self, copy=True):
+        """
+        merged conf dict, freshly built by default; `copy=False` returns a shared, read-only dict that is
+        rebuilt only after the conf is changed through its attributes or update methods
+        """
+        if copy:
+            return self._build_dict()
+        if self._dict is None:
+            self._dict = self._build_dict()
+        return self._dict
+
+    def _build_dict(self):
         return dict(
             initiator=self.initiator,
             role=self.role,
@@ -103,8 +341,7 @@ class JobConf(object):
 
     @staticmethod
     def load(path: Path):
-        with path.open("r") as f:
-            kwargs = json.load(f, object_hook=CONF_JSON_HOOK.hook)
+        kwargs = _load_json(path, CONF_JSON_HOOK.hook)
 
         return JobConf(**kwargs)
 
@@ -118,6 +355,7 @@ class JobConf(object):
         self.update_job_common_parameters(work_mode=work_mode, backend=backend)
 
     def update_job_common_parameters(self, **kwargs):
+        self._invalidate()
         if self.dsl_version == 1:
             self.job_parameters.update(**kwargs)
         else:
@@ -125,13 +363,14 @@ class JobConf(object):
 
 
 class JobDSL(object):
+    __slots__ = ('components',)
+
     def __init__(self, components: dict):
         self.components = components
 
     @staticmethod
     def load(path: Path):
-        with path.open("r") as f:
-            kwargs = json.load(f, object_hook=DSL_JSON_HOOK.hook)
+        kwargs = _load_json(path, DSL_JSON_HOOK.hook)
         return JobDSL(**kwargs)
 
     def as_dict(self):
@@ -140,40 +379,60 @@ class JobDSL(object):
 
 class Job(object):
     def __init__(self, job_name: str, job_conf: JobConf, job_dsl: typing.Optional[JobDSL],
-                 pre_works: typing.MutableSet[str]):
+                 pre_works: typing.MutableSet[str], job_dsl_path: typing.Optional[Path] = None):
         self.job_name = job_name
         self.job_conf = job_conf
-        self.job_dsl = job_dsl
         self.pre_works = pre_works
+        self._job_dsl = job_dsl
+        self._job_dsl_path = job_dsl_path
 
     @classmethod
     def load(cls, job_name, job_configs, base: Path):
-        job_conf = JobConf.load(base.joinpath(job_configs.get("conf")).resolve())
-        job_dsl = job_configs.get("dsl", None)
-        if job_dsl is not None:
-            job_dsl = JobDSL.load(base.joinpath(job_dsl).resolve())
+        job_conf = JobConf.load(_fast_join(base, job_configs.get("conf")))
+        job_dsl_path = job_configs.get("dsl", None)
+        if job_dsl_path is not None:
+            job_dsl_path = _fast_join(base, job_dsl_path)
 
         pre_works = set()
         if job_configs.get("deps", None):
             pre_works.add(job_configs["deps"])
-        return Job(job_name=job_name, job_conf=job_conf, job_dsl=job_dsl, pre_works=pre_works)
+        return Job(job_name=job_name, job_conf=job_conf, job_dsl=None, pre_works=pre_works,
+                   job_dsl_path=job_dsl_path)
+
+    @property
+    def job_dsl(self) -> typing.Optional[JobDSL]:
+        # dsl is parsed on first use, jobs that are never submitted skip it
+        if self._job_dsl is None and self._job_dsl_path is not None:
+            self._job_dsl = JobDSL.load(self._job_dsl_path)
+        return self._job_dsl
 
     @property
     def submit_params(self):
         return dict(conf=self.job_conf.as_dict(),
                     dsl=self.job_dsl.as_dict() if self.job_dsl else None)
 
+    def submit_json_bytes(self) -> bytes:
+        """
+        json body for flow's job/submit, encoded from the current conf on every call since each job is submitted
+        once; the stdlib encoder keeps wide integers and NaN/Infinity as `requests`' `json=` would
+        """
+        return json.dumps(dict(job_dsl=self.job_dsl.as_dict() if self.job_dsl else None,
+                               job_runtime_conf=self.job_conf.as_dict())).encode("utf-8")
+
     def set_pre_work(self, name, **kwargs):
-        if name not in self.pre_works:
-            raise RuntimeError(f"{self} not dependents on {name} right now")
+        try:
+            self.pre_works.remove(name)
+        except KeyError:
+            raise RuntimeError(f"{self} not dependents on {name} right now") from None
         self.job_conf.update_job_common_parameters(**kwargs)
-        self.pre_works.remove(name)
 
     def is_submit_ready(self):
-        return len(self.pre_works) == 0
+        return not self.pre_works
 
 
 class PipelineJob(object):
+    __slots__ = ('job_name', 'script_path')
+
     def __init__(self, job_name: str, script_path: Path):
         self.job_name = job_name
         self.script_path = script_path
@@ -191,35 +450,59 @@ class Testsuite(object):
         self.pipeline_jobs = pipeline_jobs
         self.path = path
 
-        self._dependency: typing.MutableMapping[str, typing.List[Job]] = {}
+        self._dependency: typing.MutableMapping[str, typing.List[Job]] = defaultdict(list)
         self._final_status: typing.MutableMapping[str, FinalStatus] = {}
-        self._ready_jobs = deque()
         for job in self.jobs:
+            final_status = FinalStatus(job.job_name)
             for name in job.pre_works:
-                self._dependency.setdefault(name, []).append(job)
-            self._final_status[job.job_name] = FinalStatus(job.job_name)
+                self._dependency[name].append(job)
+                final_status.rest_dependency.append(name)
+            self._final_status[job.job_name] = final_status
+        # lookups of unknown names should still raise KeyError
+        self._dependency.default_factory = None
+
+        # ready jobs are popped longest critical path first, ties in the order they became ready
+        self._critical_path = self._critical_path_lengths()
+        self._ready_jobs: typing.List[typing.Tuple[int, int, Job]] = []
+        self._ready_counter = itertools.count()
+        for job in self.jobs:
             if job.is_submit_ready():
-                self._ready_jobs.appendleft(job)
+                self._push_ready_job(job)
 
         for job in self.pipeline_jobs:
             self._final_status[job.job_name] = FinalStatus(job.job_name)
 
     @staticmethod
     def load(path: Path):
-        with path.open("r") as f:
-            testsuite_config = json.load(f, object_hook=DATA_JSON_HOOK.hook)
+        if _should_stream(path):
+            data_configs = _stream_json_items(path, "data.item", DATA_JSON_HOOK.hook)
+            task_configs = _stream_json_kvitems(path, "tasks", DATA_JSON_HOOK.hook)
+            pipeline_task_configs = _stream_json_kvitems(path, "pipeline_tasks", DATA_JSON_HOOK.hook)
+        else:
+            testsuite_config = _load_json(path, None)
+            data_configs = _hooked_items(testsuite_config.get("data", []), DATA_JSON_HOOK.hook)
+            task_configs = _hooked_kvitems(testsuite_config.get("tasks", {}).items(), DATA_JSON_HOOK.hook)
+            pipeline_task_configs = _hooked_kvitems(testsuite_config.get("pipeline_tasks", {}).items(),
+                                                    DATA_JSON_HOOK.hook)
 
         dataset = []
-        for d in testsuite_config.get("data"):
-            dataset.append(Data.load(d, path))
-
-        jobs = []
-        for job_name, job_configs in testsuite_config.get("tasks", {}).items():
-            jobs.append(Job.load(job_name=job_name, job_configs=job_configs, base=path.parent))
+        file_exists = _listing_file_exists()
+        for d in data_configs:
+            dataset.append(Data.load(d, path, file_exists))
+
+        task_configs = list(task_configs)
+        if len(task_configs) > _PARALLEL_LOAD_THRESHOLD:
+            # each job reads its own files, overlap their io
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                jobs = list(executor.map(lambda task: Job.load(*task, base=path.parent), task_configs))
+        else:
+            jobs = []
+            for job_name, job_configs in task_configs:
+                jobs.append(Job.load(job_name=job_name, job_configs=job_configs, base=path.parent))
 
         pipeline_jobs = []
-        for job_name, job_configs in testsuite_config.get("pipeline_tasks", {}).items():
-            script_path = path.parent.joinpath(job_configs["script"]).resolve()
+        for job_name, job_configs in pipeline_task_configs:
+            script_path = _fast_join(path.parent, job_configs["script"])
             pipeline_jobs.append(PipelineJob(job_name, script_path))
 
         testsuite = Testsuite(dataset, jobs, pipeline_jobs, path)
@@ -227,7 +510,34 @@ class Testsuite(object):
 
     def jobs_iter(self) -> typing.Generator[Job, None, None]:
         while self._ready_jobs:
-            yield self._ready_jobs.pop()
+            yield heapq.heappop(self._ready_jobs)[-1]
+
+    def _push_ready_job(self, job: Job):
+        heapq.heappush(self._ready_jobs, (-self._critical_path[job.job_name], next(self._ready_counter), job))
+
+    def _critical_path_lengths(self):
+        # Kahn order over the deps graph, then sweep it backwards so dependents are sized first;
+        # jobs stuck in a cycle never get ordered and keep length 1
+        in_degree = {job.job_name: 0 for job in self.jobs}
+        for job in self.jobs:
+            for dependent in self._dependency.get(job.job_name, ()):
+                in_degree[dependent.job_name] += 1
+
+        order = []
+        pending = deque(job for job in self.jobs if in_degree[job.job_name] == 0)
+        while pending:
+            job = pending.popleft()
+            order.append(job)
+            for dependent in self._dependency.get(job.job_name, ()):
+                in_degree[dependent.job_name] -= 1
+                if in_degree[dependent.job_name] == 0:
+                    pending.append(dependent)
+
+        lengths = {job.job_name: 1 for job in self.jobs}
+        for job in reversed(order):
+            dependents = self._dependency.get(job.job_name, ())
+            lengths[job.job_name] = 1 + max((lengths[dependent.job_name] for dependent in dependents), default=0)
+        return lengths
 
     def pretty_final_summary(self):
         table = prettytable.PrettyTable(["job_name", "job_id", "status", "exception_id", "rest_dependency"])
@@ -243,17 +553,19 @@ class Testsuite(object):
         return self._dependency[name]
 
     def remove_dependency(self, name):
-        del self._dependency[name]
+        for job in self._dependency.pop(name):
+            self._final_status[job.job_name].rest_dependency.remove(name)
 
     def feed_dep_model_info(self, job, name, model_info):
         job.set_pre_work(name, **model_info)
         if job.is_submit_ready():
-            self._ready_jobs.appendleft(job)
+            self._push_ready_job(job)
 
     def reflash_configs(self, config: Config):
 
+        common = dict(work_mode=config.work_mode, backend=config.backend)
         for data in self.dataset:
-            data.config.update(dict(work_mode=config.work_mode, backend=config.backend))
+            data.config.update(common)
 
         failed = []
         for job in self.jobs:
@@ -264,18 +576,21 @@ class Testsuite(object):
         return failed
 
     def update_status(self, job_name, job_id: str = None, status: str = None, exception_id: str = None):
-        for k, v in locals().items():
-            if k != "job_name" and v is not None:
-                setattr(self._final_status[job_name], k, v)
+        final_status = self._final_status[job_name]
+        if job_id is not None:
+            final_status.job_id = job_id
+        if status is not None:
+            final_status.status = status
+        if exception_id is not None:
+            final_status.exception_id = exception_id
 
     def get_final_status(self):
-        for name, jobs in self._dependency.items():
-            for job in jobs:
-                self._final_status[job.job_name].rest_dependency.append(name)
         return self._final_status
 
 
 class FinalStatus(object):
+    __slots__ = ('name', 'job_id', 'status', 'exception_id', 'rest_dependency')
+
     def __init__(self,
                  name: str,
                  job_id: str = "-",
@@ -290,6 +605,8 @@ class FinalStatus(object):
 
 
 class BenchmarkJob(object):
+    __slots__ = ('job_name', 'script_path', 'conf_path')
+
     def __init__(self,
                  job_name: str,
                  script_path: Path,
@@ -300,6 +617,8 @@ class BenchmarkJob(object):
 
 
 class BenchmarkPair(object):
+    __slots__ = ('pair_name', 'jobs', 'compare_setting')
+
     def __init__(self,
                  pair_name: str,
                  jobs: typing.List[BenchmarkJob],
@@ -320,24 +639,31 @@ class BenchmarkSuite(object):
 
     @staticmethod
     def load(path: Path):
-        with path.open("r") as f:
-            testsuite_config = json.load(f, object_hook=DATA_JSON_HOOK.hook)
+        if _should_stream(path):
+            data_configs = _stream_json_items(path, "data.item", DATA_JSON_HOOK.hook)
+            pair_items = _stream_json_kvitems(path, "", DATA_JSON_HOOK.hook)
+        else:
+            testsuite_config = _load_json(path, None)
+            data_configs = _hooked_items(testsuite_config.get("data", []), DATA_JSON_HOOK.hook)
+            pair_items = _hooked_kvitems(((k, v) for k, v in testsuite_config.items() if k != "data"),
+                                         DATA_JSON_HOOK.hook)
 
         dataset = []
-        for d in testsuite_config.get("data"):
-            dataset.append(Data.load(d, path))
+        file_exists = _listing_file_exists()
+        for d in data_configs:
+            dataset.append(Data.load(d, path, file_exists))
 
         pairs = []
-        for pair_name, pair_configs in testsuite_config.items():
+        for pair_name, pair_configs in pair_items:
             if pair_name == "data":
                 continue
             jobs = []
             for job_name, job_configs in pair_configs.items():
                 if job_name == "compare_setting":
                     continue
-                script_path = path.parent.joinpath(job_configs["script"]).resolve()
+                script_path = _fast_join(path.parent, job_configs["script"])
                 if job_configs.get("conf"):
-                    conf_path = path.parent.joinpath(job_configs["conf"]).resolve()
+                    conf_path = _fast_join(path.parent, job_configs["conf"])
                 else:
                     conf_path = ""
                 jobs.append(BenchmarkJob(job_name=job_name, script_path=script_path, conf_path=conf_path))
@@ -351,21 +677,37 @@ class BenchmarkSuite(object):
 
 
 def _namespace_hook(namespace):
+    if not namespace:
+        return _identity_hook
+    suffix = f"_{namespace}"
+
     def _hook(d):
-        if d is None:
-            return d
-        if 'namespace' in d and namespace:
-            d['namespace'] = f"{d['namespace']}_{namespace}"
+        if d is not None and 'namespace' in d:
+            d['namespace'] = f"{d['namespace']}{suffix}"
         return d
 
     return _hook
 
 
 def _replace_hook(mapping: dict):
+    if not mapping:
+        return _identity_hook
+
+    if len(mapping) == 1:
+        (key, value), = mapping.items()
+
+        def _hook(d):
+            if key in d:
+                d[key] = value
+            return d
+
+        return _hook
+
+    keys = frozenset(mapping)
+
     def _hook(d):
-        for k, v in mapping.items():
-            if k in d:
-                d[k] = v
+        for k in d.keys() & keys:
+            d[k] = mapping[k]
         return d
 
     return _hook
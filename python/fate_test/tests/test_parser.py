@@ -0,0 +1,190 @@
+import json
+import random
+
+import pytest
+
+from fate_test import _parser
+
+
+def _job(name, dep=None):
+    return _parser.Job(job_name=name, job_conf=None, job_dsl=None, pre_works={dep} if dep else set())
+
+
+def test_jobs_iter_prefers_longest_critical_path():
+    suite = _parser.Testsuite([], [_job("a"), _job("b"), _job("c", "b"), _job("d")], [], None)
+    assert [job.job_name for job in suite.jobs_iter()] == ["b", "a", "d"]
+
+
+def test_long_dependency_chain():
+    n = 5000
+    jobs = [_job("j0")] + [_job(f"j{i}", f"j{i - 1}") for i in range(1, n)]
+    suite = _parser.Testsuite([], jobs, [], None)
+    assert suite._critical_path["j0"] == n
+    assert suite._critical_path[f"j{n - 1}"] == 1
+    assert [job.job_name for job in suite.jobs_iter()] == ["j0"]
+
+
+def test_cyclic_deps_do_not_hang():
+    suite = _parser.Testsuite([], [_job("a", "b"), _job("b", "a"), _job("c")], [], None)
+    assert suite._critical_path == {"a": 1, "b": 1, "c": 1}
+    assert [job.job_name for job in suite.jobs_iter()] == ["c"]
+
+
+def test_listing_file_exists_matches_path_exists(tmp_path):
+    (tmp_path / "data.csv").write_text("x")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "dangling.csv").symlink_to(tmp_path / "missing.csv")
+    (tmp_path / "link.csv").symlink_to(tmp_path / "data.csv")
+    file_exists = _parser._listing_file_exists()
+    for name in ["data.csv", "sub", "dangling.csv", "link.csv", "missing.csv", "nodir/data.csv"]:
+        assert file_exists(tmp_path / name) == (tmp_path / name).exists()
+
+
+def test_json_loads_matches_stdlib():
+    for s in [b'{"a": [1, 2.5, "x", null]}',
+              b'{"id": 123456789012345678901234567890}',
+              b'{"a": -9999999999999999999, "b": 18446744073709551616}',
+              b'{"v": NaN, "w": -Infinity}']:
+        assert repr(_parser._json_loads(s)) == repr(json.loads(s))
+
+
+def test_submit_json_bytes_sees_in_place_changes():
+    conf = _parser.JobConf(initiator={"role": "guest"}, role={"guest": [9999]}, job_parameters={}, dsl_version=2)
+    job = _parser.Job(job_name="job", job_conf=conf, job_dsl=None, pre_works=set())
+    conf.as_dict(copy=False)
+    conf.others_kwargs["component_parameters"] = {"common": {}}
+    conf.job_parameters["common"] = {"backend": 0}
+    body = json.loads(job.submit_json_bytes())
+    assert body["job_dsl"] is None
+    assert body["job_runtime_conf"]["component_parameters"] == {"common": {}}
+    assert body["job_runtime_conf"]["job_parameters"] == {"common": {"backend": 0}}
+
+
+_DATA = [{"file": "a.csv", "head": 1, "partition": 4, "table_name": "t", "namespace": "n", "role": "guest"}]
+
+
+def _load_both_ways(monkeypatch, suite_cls, suite_path, summary):
+    if _parser.ijson is None:
+        pytest.skip("ijson>=3.1 not installed")
+    hook = _parser.chain_hook().add_extend_namespace_hook("x")
+    # a replace hook matching top-level keys must not touch the suite skeleton on either path
+    hook.add_replace_hook({"partition": 8, "tasks": {}, "pair": {}})
+    monkeypatch.setattr(_parser, "DATA_JSON_HOOK", hook)
+    full = summary(suite_cls.load(suite_path))
+    monkeypatch.setattr(_parser, "_STREAM_THRESHOLD", 0)
+    assert summary(suite_cls.load(suite_path)) == full
+    return full
+
+
+@pytest.mark.parametrize("with_data", [True, False])
+def test_streamed_testsuite_matches_full_load(tmp_path, monkeypatch, with_data):
+    (tmp_path / "conf.json").write_text(json.dumps(
+        {"initiator": {"role": "guest"}, "role": {"guest": [9999]}, "job_parameters": {"work_mode": 0}}))
+    suite = {"tasks": {"job": {"conf": "conf.json"}}, "pipeline_tasks": {"pipe": {"script": "pipe.py"}}}
+    if with_data:
+        suite["data"] = _DATA
+    suite_path = tmp_path / "x_testsuite.json"
+    suite_path.write_text(json.dumps(suite))
+
+    def _summary(loaded):
+        return ([d.config for d in loaded.dataset],
+                [(j.job_name, j.submit_params) for j in loaded.jobs],
+                [(j.job_name, j.script_path) for j in loaded.pipeline_jobs])
+
+    dataset, jobs, pipeline_jobs = _load_both_ways(monkeypatch, _parser.Testsuite, suite_path, _summary)
+    assert [d["namespace"] for d in dataset] == (["n_x"] if with_data else [])
+    assert [d["partition"] for d in dataset] == ([8] if with_data else [])
+    assert [name for name, _ in jobs] == ["job"]
+    assert [name for name, _ in pipeline_jobs] == ["pipe"]
+
+
+@pytest.mark.parametrize("with_data", [True, False])
+def test_streamed_benchmark_matches_full_load(tmp_path, monkeypatch, with_data):
+    suite = {"pair": {"local": {"script": "local.py", "conf": "conf.yaml"},
+                      "FATE": {"script": "fate.py"},
+                      "compare_setting": {"relative_tol": 0.01}}}
+    if with_data:
+        suite["data"] = _DATA
+    suite_path = tmp_path / "x_benchmark.json"
+    suite_path.write_text(json.dumps(suite))
+
+    def _summary(loaded):
+        return ([d.config for d in loaded.dataset],
+                [(p.pair_name, p.compare_setting, [(j.job_name, j.script_path, j.conf_path) for j in p.jobs])
+                 for p in loaded.pairs])
+
+    dataset, pairs = _load_both_ways(monkeypatch, _parser.BenchmarkSuite, suite_path, _summary)
+    assert [d["namespace"] for d in dataset] == (["n_x"] if with_data else [])
+    assert [(name, [job[0] for job in jobs]) for name, _, jobs in pairs] == [("pair", ["local", "FATE"])]
+
+
+def test_job_conf_as_dict():
+    conf = _parser.JobConf(initiator={"role": "guest"}, role={"guest": [9999]}, job_parameters={}, dsl_version=2)
+    fresh = conf.as_dict()
+    fresh["extra"] = 1
+    assert "extra" not in conf.as_dict()
+    assert conf.as_dict(copy=False) is conf.as_dict(copy=False)
+    conf.update_job_common_parameters(backend=0)
+    assert conf.as_dict(copy=False)["job_parameters"] == {"common": {"backend": 0}}
+
+
+def test_submit_json_bytes_encodes_like_stdlib():
+    conf = _parser.JobConf(initiator={"role": "guest"}, role={"guest": [9999]},
+                           job_parameters={"seed": 2 ** 70, "tol": float("nan"), "max": float("inf")})
+    job = _parser.Job(job_name="job", job_conf=conf, job_dsl=None, pre_works=set())
+    body = job.submit_json_bytes()
+    assert body == json.dumps({"job_dsl": None, "job_runtime_conf": conf.as_dict()}).encode("utf-8")
+    assert b"NaN" in body and b"Infinity" in body and str(2 ** 70).encode() in body
+
+
+def test_final_status_rest_dependency_is_idempotent():
+    suite = _parser.Testsuite([], [_job("a"), _job("b", "a"), _job("c", "a"), _job("d", "c")], [], None)
+
+    def _rest():
+        return {name: list(status.rest_dependency) for name, status in suite.get_final_status().items()}
+
+    expected = {"a": [], "b": ["a"], "c": ["a"], "d": ["c"]}
+    assert _rest() == expected
+    summary = suite.pretty_final_summary()
+    assert suite.pretty_final_summary() == summary
+    assert _rest() == expected
+
+    suite.remove_dependency("a")
+    assert _rest() == {"a": [], "b": [], "c": [], "d": ["c"]}
+    assert _rest() == {"a": [], "b": [], "c": [], "d": ["c"]}
+
+
+def _random_json(rng, depth=0):
+    if depth > 4 or rng.random() < 0.3:
+        return rng.choice([1, 2.5, "a", None, "namespace", True])
+    if rng.random() < 0.5:
+        return [_random_json(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return {rng.choice(["namespace", "k", "drop", "max_iter"]): _random_json(rng, depth + 1)
+            for _ in range(rng.randint(0, 4))}
+
+
+def _children_hooked(d):
+    for v in d.values():
+        for child in (v if isinstance(v, list) else [v]):
+            if isinstance(child, dict) and not child.get("_hooked"):
+                return False
+    return True
+
+
+def test_apply_hook_matches_json_object_hook():
+    def _mark(d):
+        # innermost first: every nested dict must already be hooked
+        assert _children_hooked(d)
+        d["_hooked"] = True
+        return d
+
+    def _drop(d):
+        # None replaces the dict in its parent and stops the rest of the chain
+        return None if d.get("drop") == 1 else d
+
+    hook = _parser.chain_hook().add_hook(_drop).add_extend_namespace_hook("x").add_hook(_mark)
+    hook.add_replace_hook({"max_iter": 3})
+    rng = random.Random(0)
+    for _ in range(3000):
+        s = json.dumps(_random_json(rng))
+        assert _parser._apply_hook(json.loads(s), hook.hook) == json.loads(s, object_hook=hook.hook), s